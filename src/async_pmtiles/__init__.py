@@ -1,6 +1,6 @@
 """async-pmtiles: asynchronous interface for reading PMTiles files."""
 
-from ._reader import PMTilesReader, Store
+from ._reader import BudgetExceededError, PMTilesReader, Store
 from ._version import __version__
 
-__all__ = ["PMTilesReader", "Store", "__version__"]
+__all__ = ["BudgetExceededError", "PMTilesReader", "Store", "__version__"]
@@ -0,0 +1,88 @@
+"""Parsing of PMTiles directories into column arrays."""
+
+from __future__ import annotations
+
+from itertools import accumulate
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from array import array
+
+
+def _read_varints(data: bytes, pos: int, count: int) -> tuple[list[int], int]:
+    """Read `count` unsigned LEB128 varints from `data`, starting at `pos`.
+
+    Returns:
+        The decoded values and the position just past the last one.
+
+    """
+    values = []
+    append = values.append
+    for _ in range(count):
+        value = 0
+        shift = 0
+        while True:
+            byte = data[pos]
+            pos += 1
+            value |= (byte & 0x7F) << shift
+            if byte < 0x80:  # noqa: PLR2004
+                break
+            shift += 7
+        append(value)
+
+    return values, pos
+
+
+def parse_directory_into(
+    data: bytes,
+    out_ids: array[int],
+    out_offsets: array[int],
+    out_lengths: array[int],
+    out_runs: array[int],
+) -> int:
+    """Parse a decompressed PMTiles directory into column arrays.
+
+    Unlike `pmtiles.tile.deserialize_directory`, no `Entry` object is created per
+    entry: the tile IDs, offsets, lengths, and run lengths are appended to the
+    given arrays directly.
+
+    Args:
+        data: The directory bytes, after internal decompression.
+        out_ids: Receives the tile ID of each entry.
+        out_offsets: Receives the offset of each entry, relative to the tile data
+            or leaf directory section.
+        out_lengths: Receives the length of each entry.
+        out_runs: Receives the run length of each entry, where `0` marks a leaf
+            directory.
+
+    Raises:
+        EOFError: If the directory is truncated.
+
+    Returns:
+        The number of entries parsed.
+
+    """
+    try:
+        (num_entries,), pos = _read_varints(data, 0, 1)
+        id_deltas, pos = _read_varints(data, pos, num_entries)
+        run_lengths, pos = _read_varints(data, pos, num_entries)
+        lengths, pos = _read_varints(data, pos, num_entries)
+        raw_offsets, pos = _read_varints(data, pos, num_entries)
+    except IndexError as e:
+        msg = "Directory ended before all entries were read"
+        raise EOFError(msg) from e
+
+    # An encoded offset of 0 means the entry directly follows the previous one;
+    # otherwise it is stored as offset + 1.
+    offsets = []
+    next_offset = 0
+    for i, (raw_offset, length) in enumerate(zip(raw_offsets, lengths, strict=True)):
+        offset = next_offset if i > 0 and raw_offset == 0 else raw_offset - 1
+        offsets.append(offset)
+        next_offset = offset + length
+
+    out_ids.extend(accumulate(id_deltas))
+    out_offsets.extend(offsets)
+    out_lengths.extend(lengths)
+    out_runs.extend(run_lengths)
+    return num_entries
@@ -2,22 +2,28 @@
 
 from __future__ import annotations
 
-import gzip
-import json
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Protocol, Self
+import asyncio
+import os
+from array import array
+from bisect import bisect_right
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import cache
+from typing import TYPE_CHECKING, NamedTuple, Protocol, Self, TypeVar
 
 from pmtiles.tile import (
     Compression,
     TileType,
-    deserialize_directory,
     deserialize_header,
-    find_tile,
     zxy_to_tileid,
 )
 
+from ._directory import parse_directory_into
+
 if TYPE_CHECKING:
     import sys
+    from collections.abc import Awaitable, Callable
+    from types import ModuleType, TracebackType
 
     from pmtiles.tile import HeaderDict
 
@@ -26,6 +32,67 @@ if TYPE_CHECKING:
     else:
         from typing_extensions import Buffer
 
+T = TypeVar("T")
+
+
+# Compression modules are imported on first use rather than at import time, so
+# that readers which never decompress don't pay for them (or for ISA-L).
+@cache
+def _gzip() -> ModuleType:
+    """Return the gzip implementation, preferring ISA-L when installed."""
+    try:
+        from isal import igzip  # noqa: PLC0415
+    except ImportError:
+        import gzip  # noqa: PLC0415
+
+        return gzip
+
+    return igzip
+
+
+@cache
+def _zlib() -> ModuleType:
+    """Return the zlib implementation, preferring ISA-L when installed."""
+    try:
+        from isal import isal_zlib  # noqa: PLC0415
+    except ImportError:
+        import zlib  # noqa: PLC0415
+
+        return zlib
+
+    return isal_zlib
+
+
+def _decompress_gzip(data: Buffer) -> bytes:
+    return _gzip().decompress(data)
+
+
+# json.loads only accepts str, bytes, or bytearray, hence `bytes` for NONE.
+# Brotli and Zstd can be supported by adding entries here.
+_DECOMPRESSORS: dict[Compression, Callable[[Buffer], bytes]] = {
+    Compression.NONE: bytes,
+    Compression.GZIP: _decompress_gzip,
+}
+"""Decompression functions for the archive's internal compression."""
+
+
+def _unsupported_compression(compression: Compression) -> NotImplementedError:
+    if compression == Compression.UNKNOWN:
+        return NotImplementedError("Unknown compression is not supported")
+
+    name = compression.name.capitalize()
+    return NotImplementedError(f"{name} compression is not yet supported")
+
+
+_DEFAULT_COALESCE_GAP = 16384
+_DEFAULT_COALESCE_SIZE = 1 << 20
+
+_DECOMPRESS_THREAD_THRESHOLD = 16384
+"""Compressed size above which metadata is decompressed in a worker thread.
+
+Below this, dispatching to the thread pool costs more than inflating inline.
+"""
+
 
 class Store(Protocol):
     """A generic protocol for accessing byte ranges of files.
@@ -58,7 +125,94 @@ class Store(Protocol):
         ...
 
 
-@dataclass()
+class BudgetExceededError(RuntimeError):
+    """Raised when a read would exceed a reader's `bytes_budget`."""
+
+
+class _Directory(NamedTuple):
+    """A deserialized directory, stored column-wise for repeated tile lookups."""
+
+    tile_ids: array[int]
+    """The sorted tile ID of each entry, for binary search."""
+
+    offsets: array[int]
+    """The offset of each entry."""
+
+    lengths: array[int]
+    """The length of each entry."""
+
+    run_lengths: array[int]
+    """The run length of each entry, where `0` marks a leaf directory."""
+
+
+def _deserialize_directory(buf: Buffer, compression: Compression) -> _Directory:
+    if (decompress := _DECOMPRESSORS.get(compression)) is None:
+        raise _unsupported_compression(compression)
+
+    directory = _Directory(array("Q"), array("Q"), array("I"), array("I"))
+    parse_directory_into(decompress(buf), *directory)
+    return directory
+
+
+def _find_tile_fast(directory: _Directory, tile_id: int) -> int | None:
+    """Find the row of the entry containing `tile_id`, like `pmtiles.tile.find_tile`.
+
+    The search runs with `bisect` over the packed tile ID column, rather than a
+    Python-level binary search over entry objects, and only the matching row's
+    values are ever read from the other columns.
+    """
+    i = bisect_right(directory.tile_ids, tile_id) - 1
+    if i < 0:
+        return None
+
+    # Leaf directory entries (run_length == 0) cover every ID up to the next entry
+    run_length = directory.run_lengths[i]
+    if run_length == 0 or tile_id - directory.tile_ids[i] < run_length:
+        return i
+
+    return None
+
+
+def _coalesce_ranges(
+    ranges: list[tuple[int, int, int]],
+    *,
+    max_gap: int,
+    max_size: int,
+) -> list[tuple[int, int, list[tuple[int, int, int]]]]:
+    """Merge nearby byte ranges into larger runs.
+
+    Args:
+        ranges: `(index, offset, length)` triples, in any order.
+        max_gap: The largest gap in bytes to read through between two ranges.
+            Overlapping ranges are merged when this is `0` or more; a negative
+            value disables merging entirely.
+        max_size: The maximum size in bytes of a merged run. A single range larger
+            than this forms its own run.
+
+    Returns:
+        `(start, end, members)` triples, where `members` are the input triples
+        covered by the half-open byte range `[start, end)`.
+
+    """
+    runs: list[tuple[int, int, list[tuple[int, int, int]]]] = []
+    for item in sorted(ranges, key=lambda item: item[1]):
+        _, offset, length = item
+        # Overlapping ranges, such as deduplicated tiles sharing an offset, have a
+        # negative gap, so a negative max_gap must skip merging explicitly
+        if runs and max_gap >= 0:
+            start, end, members = runs[-1]
+            new_end = max(end, offset + length)
+            if offset - end <= max_gap and new_end - start <= max_size:
+                members.append(item)
+                runs[-1] = (start, new_end, members)
+                continue
+
+        runs.append((offset, offset + length, [item]))
+
+    return runs
+
+
+@dataclass(slots=True)
 class PMTilesReader:
     """An asynchronous [PMTiles] Reader.
 
@@ -74,58 +228,316 @@ class PMTilesReader:
     header: HeaderDict
     """The underlying raw PMTiles header metadata."""
 
+    max_concurrency: int | None = None
+    """The maximum number of tiles fetched concurrently by
+    [get_tiles][async_pmtiles.PMTilesReader.get_tiles].
+
+    Defaults to the `ASYNC_PMTILES_CONCURRENCY` environment variable, or 8. Must be
+    at least 1.
+    """
+
+    max_coalesce_gap: int | None = None
+    """The largest gap in bytes between two tiles that
+    [get_tiles_batch][async_pmtiles.PMTilesReader.get_tiles_batch] will read
+    through to fetch both in a single request.
+
+    Defaults to the `ASYNC_PMTILES_COALESCE_GAP` environment variable, or 16384.
+    Set to `0` to only merge adjacent tiles and tiles sharing an offset (PMTiles
+    stores identical tiles once), or to a negative value to disable coalescing so
+    that every tile is requested separately.
+    """
+
+    max_coalesce_size: int = _DEFAULT_COALESCE_SIZE
+    """The maximum size in bytes of a single coalesced request."""
+
+    cache_size: int = 64
+    """The maximum number of deserialized directories to keep in memory.
+
+    PMTiles archives are immutable, so cached directories never need to be
+    invalidated. Set to `0` to disable caching.
+    """
+
+    bytes_budget: int | None = None
+    """The maximum total number of bytes this reader may request from the store.
+
+    A read that would exceed the budget raises
+    [BudgetExceededError][async_pmtiles.BudgetExceededError] before it is issued.
+    `None` means unlimited.
+    """
+
+    on_fetch: Callable[[int, int], None] | None = field(default=None, compare=False)
+    """A callback invoked with `(offset, length)` for every range request.
+
+    Useful for exporting metrics, e.g. to Prometheus or OpenTelemetry.
+    """
+
+    _fetch_count: int = field(default=0, init=False, repr=False, compare=False)
+    _fetched_bytes: int = field(default=0, init=False, repr=False, compare=False)
+    _cache_hits: int = field(default=0, init=False, repr=False, compare=False)
+
+    _semaphore: asyncio.Semaphore = field(init=False, repr=False, compare=False)
+    _dir_cache: OrderedDict[tuple[int, int], _Directory] = field(
+        default_factory=OrderedDict,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
+    # Header-derived values, computed once since the archive is immutable
+    _minzoom: int = field(init=False, repr=False, compare=False)
+    _maxzoom: int = field(init=False, repr=False, compare=False)
+    _bounds: tuple[float, float, float, float] = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _center: tuple[float, float, int] = field(init=False, repr=False, compare=False)
+    _tile_compression: Compression = field(init=False, repr=False, compare=False)
+    _tile_type: TileType = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        header = self.header
+        self._minzoom = header["min_zoom"]
+        self._maxzoom = header["max_zoom"]
+        self._bounds = (
+            header["min_lon_e7"] / 10000000,
+            header["min_lat_e7"] / 10000000,
+            header["max_lon_e7"] / 10000000,
+            header["max_lat_e7"] / 10000000,
+        )
+        self._center = (
+            header["center_lon_e7"] / 10000000,
+            header["center_lat_e7"] / 10000000,
+            header["center_zoom"],
+        )
+        self._tile_compression = header["tile_compression"]
+        self._tile_type = header["tile_type"]
+
+        if self.max_concurrency is None:
+            self.max_concurrency = int(
+                os.environ.get("ASYNC_PMTILES_CONCURRENCY", "8"),
+            )
+        if self.max_concurrency < 1:
+            # A zero-sized semaphore would make get_tiles wait forever
+            msg = f"max_concurrency must be at least 1, got {self.max_concurrency}"
+            raise ValueError(msg)
+        if self.max_coalesce_gap is None:
+            self.max_coalesce_gap = int(
+                os.environ.get("ASYNC_PMTILES_COALESCE_GAP", _DEFAULT_COALESCE_GAP),
+            )
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+    # The keyword-only options mirror the reader's dataclass fields
     @classmethod
-    async def open(cls, path: str, *, store: Store) -> Self:
+    async def open(  # noqa: PLR0913
+        cls,
+        path: str,
+        *,
+        store: Store,
+        max_concurrency: int | None = None,
+        max_coalesce_gap: int | None = None,
+        max_coalesce_size: int = _DEFAULT_COALESCE_SIZE,
+        cache_size: int = 64,
+        prefetch_bytes: int = 16384,
+        bytes_budget: int | None = None,
+        on_fetch: Callable[[int, int], None] | None = None,
+    ) -> Self:
         """Open a PMTiles file.
 
         Args:
             path: The path within the store to the PMTiles file.
             store: A generic "store" that implements fetching byte ranges
                 asynchronously.
+            max_concurrency: The maximum number of tiles fetched concurrently by
+                [get_tiles][async_pmtiles.PMTilesReader.get_tiles]. Defaults to the
+                `ASYNC_PMTILES_CONCURRENCY` environment variable, or 8. Must be at
+                least 1.
+            max_coalesce_gap: The largest gap in bytes between two tiles that
+                [get_tiles_batch][async_pmtiles.PMTilesReader.get_tiles_batch]
+                will read through to fetch both in a single request. Defaults to
+                the `ASYNC_PMTILES_COALESCE_GAP` environment variable, or 16384.
+                A negative value disables coalescing.
+            max_coalesce_size: The maximum size in bytes of a single coalesced
+                request.
+            cache_size: The maximum number of deserialized directories to keep in
+                memory. Set to `0` to disable caching.
+            prefetch_bytes: The number of bytes to request from the start of the
+                file. When this covers the root directory, it is loaded without an
+                additional request. Values below the 127-byte header size are
+                rounded up.
+            bytes_budget: The maximum total number of bytes the reader may request
+                from the store, including the initial prefix. `None` means
+                unlimited.
+            on_fetch: A callback invoked with `(offset, length)` for every range
+                request.
 
         Raises:
-            ValueError: If the PMTiles version is unsupported.
+            ValueError: If the PMTiles version is unsupported, or `max_concurrency`
+                is less than 1.
+            BudgetExceededError: If the initial prefix exceeds `bytes_budget`.
 
         Returns:
             An instance of PMTilesReader.
 
         """
-        header_values = await store.get_range_async(
-            path,
-            start=0,
-            length=127,
+        # Fetch more than the 127-byte header so that, for most archives, the root
+        # directory (which usually follows the header) arrives in the same request.
+        prefix_length = max(prefetch_bytes, 127)
+        if bytes_budget is not None and prefix_length > bytes_budget:
+            # Checked before any request is made, since the reader that enforces
+            # the budget does not exist yet
+            msg = (
+                f"Reading {prefix_length} bytes at offset 0 would exceed the "
+                f"budget of {bytes_budget} bytes"
+            )
+            raise BudgetExceededError(msg)
+
+        prefix = memoryview(
+            await store.get_range_async(path, start=0, length=prefix_length),
         )
-        spec_version = memoryview(header_values)[7]
+        spec_version = prefix[7]
         if spec_version != 3:  # noqa: PLR2004
             msg = f"Unsupported PMTiles spec version: {spec_version}"
             raise ValueError(msg)
 
         # https://github.com/protomaps/PMTiles/pull/638 allows passing a buffer directly
-        header = deserialize_header(bytes(header_values))
+        header = deserialize_header(prefix[:127])
+
+        reader = cls(
+            path=path,
+            store=store,
+            header=header,
+            max_concurrency=max_concurrency,
+            max_coalesce_gap=max_coalesce_gap,
+            max_coalesce_size=max_coalesce_size,
+            cache_size=cache_size,
+            bytes_budget=bytes_budget,
+            on_fetch=on_fetch,
+        )
+        # The prefix was requested before the reader existed; account for it now
+        reader._record_fetch(0, prefix_length)
+
+        if cache_size > 0:
+            # Every tile lookup starts from the root directory, so load it up front,
+            # reusing the prefetched bytes when they cover it.
+            root_offset = header["root_offset"]
+            root_length = header["root_length"]
+            root_end = root_offset + root_length
+            if root_end <= len(prefix):
+                reader._cache_dir(
+                    (root_offset, root_length),
+                    _deserialize_directory(
+                        prefix[root_offset:root_end],
+                        header["internal_compression"],
+                    ),
+                )
+            else:
+                await reader._get_dir(root_offset, root_length)
+
+        return reader
+
+    async def _get_dir(self, offset: int, length: int) -> _Directory:
+        """Fetch and deserialize a directory, consulting the directory cache."""
+        key = (offset, length)
+        if (directory := self._dir_cache.get(key)) is not None:
+            self._dir_cache.move_to_end(key)
+            self._cache_hits += 1
+            return directory
+
+        directory_values = await self._fetch(offset, length)
+        directory = _deserialize_directory(
+            directory_values,
+            self.header["internal_compression"],
+        )
+
+        self._cache_dir(key, directory)
+        return directory
+
+    def _record_fetch(self, offset: int, length: int) -> None:
+        """Account for a range request, enforcing `bytes_budget`."""
+        if (
+            self.bytes_budget is not None
+            and self._fetched_bytes + length > self.bytes_budget
+        ):
+            msg = (
+                f"Reading {length} bytes at offset {offset} would exceed the "
+                f"budget of {self.bytes_budget} bytes "
+                f"({self._fetched_bytes} already read)"
+            )
+            raise BudgetExceededError(msg)
+
+        self._fetch_count += 1
+        self._fetched_bytes += length
+        if self.on_fetch is not None:
+            self.on_fetch(offset, length)
+
+    async def _fetch(self, offset: int, length: int) -> Buffer:
+        """Fetch a byte range from the archive, with accounting."""
+        self._record_fetch(offset, length)
+        return await self.store.get_range_async(
+            self.path,
+            start=offset,
+            length=length,
+        )
+
+    def _cache_dir(self, key: tuple[int, int], directory: _Directory) -> None:
+        """Insert a directory into the cache, evicting the least recently used."""
+        if self.cache_size <= 0:
+            return
+
+        self._dir_cache[key] = directory
+        while len(self._dir_cache) > self.cache_size:
+            self._dir_cache.popitem(last=False)
+
+    def close(self) -> None:
+        """Release the directory cache.
 
-        return cls(path=path, store=store, header=header)
+        The underlying store is not closed, since it may be shared between
+        readers. The reader remains usable afterwards, but directories will be
+        fetched again as needed.
+        """
+        self._dir_cache.clear()
+
+    async def __aenter__(self) -> Self:
+        """Use the reader as an async context manager, closing it on exit.
+
+        ```py
+        async with await PMTilesReader.open(path, store=store) as src:
+            tile = await src.get_tile(x=0, y=0, z=0)
+        ```
+        """
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
 
     async def metadata(self) -> dict:
         """Load user-defined metadata stored in the PMTiles archive."""
-        metadata = await self.store.get_range_async(
-            self.path,
-            start=self.header["metadata_offset"],
-            length=self.header["metadata_length"],
+        metadata = await self._fetch(
+            self.header["metadata_offset"],
+            self.header["metadata_length"],
         )
-        match self.header["internal_compression"]:
-            case Compression.NONE:
-                metadata = bytes(metadata)
-            case Compression.GZIP:
-                metadata = gzip.decompress(metadata)
-            case Compression.BROTLI:
-                raise NotImplementedError("Brotli compression is not yet supported")
-            case Compression.ZSTD:
-                raise NotImplementedError("Zstd compression is not yet supported")
-            case Compression.UNKNOWN:
-                # What to do here? Maybe just warn?
-                raise NotImplementedError("Unknown compression is not supported")
-            case _:
-                raise NotImplementedError
+        compression = self.header["internal_compression"]
+        if (decompress := _DECOMPRESSORS.get(compression)) is None:
+            raise _unsupported_compression(compression)
+
+        # Decompress straight from the store's buffer, without an extra copy.
+        # Large compressed blobs are inflated off the event loop so other tasks
+        # can run.
+        if (
+            compression != Compression.NONE
+            and self.header["metadata_length"] > _DECOMPRESS_THREAD_THRESHOLD
+        ):
+            metadata = await asyncio.to_thread(decompress, metadata)
+        else:
+            metadata = decompress(metadata)
+
+        import json  # noqa: PLC0415
 
         return json.loads(metadata)
 
@@ -139,62 +551,194 @@ class PMTilesReader:
         dir_offset = self.header["root_offset"]
         dir_length = self.header["root_length"]
         for _ in range(4):  # max depth
-            directory_values = await self.store.get_range_async(
-                self.path,
-                start=dir_offset,
-                length=dir_length,
-            )
-            directory = deserialize_directory(directory_values)
+            directory = await self._get_dir(dir_offset, dir_length)
 
-            if result := find_tile(directory, tile_id):
-                if result.run_length == 0:
-                    dir_offset = self.header["leaf_directory_offset"] + result.offset
-                    dir_length = result.length
+            if (i := _find_tile_fast(directory, tile_id)) is None:
+                return None
 
-                else:
-                    return await self.store.get_range_async(
-                        self.path,
-                        start=self.header["tile_data_offset"] + result.offset,
-                        length=result.length,
-                    )
+            if directory.run_lengths[i] == 0:
+                dir_offset = self.header["leaf_directory_offset"] + directory.offsets[i]
+                dir_length = directory.lengths[i]
+            else:
+                return await self._fetch(
+                    self.header["tile_data_offset"] + directory.offsets[i],
+                    directory.lengths[i],
+                )
 
         return None
 
+    def decompress_tile(self, data: Buffer) -> Buffer:
+        """Decompress tile data according to the archive's tile compression.
+
+        Args:
+            data: Tile data, as returned by
+                [get_tile][async_pmtiles.PMTilesReader.get_tile].
+
+        Returns:
+            The decompressed tile data.
+
+        """
+        compression = self._tile_compression
+        if compression == Compression.GZIP:
+            return _zlib().decompress(data, wbits=31)
+        if compression == Compression.NONE:
+            return data
+
+        raise _unsupported_compression(compression)
+
+    async def get_tiles(
+        self,
+        coords: list[tuple[int, int, int]],
+    ) -> list[Buffer | None]:
+        """Load data for many tiles concurrently.
+
+        At most `max_concurrency` tiles are fetched at once. Note that no
+        decompression is applied.
+
+        Args:
+            coords: A list of `(x, y, z)` tile coordinates.
+
+        Returns:
+            The tile data for each coordinate, in the same order as `coords`.
+
+        """
+        return await asyncio.gather(
+            *(self._limited(self.get_tile(x, y, z)) for x, y, z in coords),
+        )
+
+    async def get_tiles_batch(
+        self,
+        coords: list[tuple[int, int, int]],
+    ) -> list[Buffer | None]:
+        """Load data for many tiles, sharing directory lookups between them.
+
+        Unlike [get_tiles][async_pmtiles.PMTilesReader.get_tiles], which descends
+        the directory tree independently for each tile, this walks the tree one
+        level at a time for the whole batch: each distinct leaf directory is
+        fetched once, and all tile data is then fetched concurrently. Tiles stored
+        within `max_coalesce_gap` bytes of each other are read with a single
+        request and sliced apart in memory. At most `max_concurrency` requests are
+        in flight at once. Note that no decompression is applied.
+
+        Args:
+            coords: A list of `(x, y, z)` tile coordinates.
+
+        Returns:
+            The tile data for each coordinate, in the same order as `coords`.
+
+        """
+        header = self.header
+        results: list[Buffer | None] = [None] * len(coords)
+
+        # (index, tile_id) pairs still to be resolved, keyed by the directory to
+        # search next
+        pending: dict[tuple[int, int], list[tuple[int, int]]] = {
+            (header["root_offset"], header["root_length"]): [
+                (index, zxy_to_tileid(z, x, y))
+                for index, (x, y, z) in enumerate(coords)
+            ],
+        }
+        # (index, offset, length) of tile data to fetch
+        located: list[tuple[int, int, int]] = []
+        for _ in range(4):  # max depth
+            if not pending:
+                break
+
+            keys = list(pending)
+            directories = await asyncio.gather(
+                *(self._limited(self._get_dir(*key)) for key in keys),
+            )
+
+            next_pending: dict[tuple[int, int], list[tuple[int, int]]] = {}
+            for key, directory in zip(keys, directories, strict=True):
+                for index, tile_id in pending[key]:
+                    if (i := _find_tile_fast(directory, tile_id)) is None:
+                        continue
+
+                    if directory.run_lengths[i] == 0:
+                        leaf = (
+                            header["leaf_directory_offset"] + directory.offsets[i],
+                            directory.lengths[i],
+                        )
+                        next_pending.setdefault(leaf, []).append((index, tile_id))
+                    else:
+                        located.append(
+                            (
+                                index,
+                                header["tile_data_offset"] + directory.offsets[i],
+                                directory.lengths[i],
+                            ),
+                        )
+
+            pending = next_pending
+
+        runs = _coalesce_ranges(
+            located,
+            max_gap=self.max_coalesce_gap,
+            max_size=self.max_coalesce_size,
+        )
+        responses = await asyncio.gather(
+            *(self._limited(self._fetch(start, end - start)) for start, end, _ in runs),
+        )
+        for (start, _end, members), response in zip(runs, responses, strict=True):
+            if len(members) == 1:
+                index, _, _ = members[0]
+                results[index] = response
+                continue
+
+            view = memoryview(response)
+            for index, offset, length in members:
+                rel_start = offset - start
+                results[index] = view[rel_start : rel_start + length]
+
+        return results
+
+    async def _limited(self, aw: Awaitable[T]) -> T:
+        """Await `aw` while holding the reader's concurrency semaphore."""
+        async with self._semaphore:
+            return await aw
+
+    @property
+    def fetch_count(self) -> int:
+        """The number of range requests issued by this reader."""
+        return self._fetch_count
+
+    @property
+    def fetched_bytes(self) -> int:
+        """The total number of bytes requested by this reader."""
+        return self._fetched_bytes
+
+    @property
+    def cache_hits(self) -> int:
+        """The number of directory lookups served from the directory cache."""
+        return self._cache_hits
+
     @property
     def minzoom(self) -> int:
         """The minimum zoom of the archive."""
-        return self.header["min_zoom"]
+        return self._minzoom
 
     @property
     def maxzoom(self) -> int:
         """The maximum zoom of the archive."""
-        return self.header["max_zoom"]
+        return self._maxzoom
 
     @property
     def bounds(self) -> tuple[float, float, float, float]:
         """The bounding box of the archive as (min_lon, min_lat, max_lon, max_lat)."""
-        return (
-            self.header["min_lon_e7"] / 10000000,
-            self.header["min_lat_e7"] / 10000000,
-            self.header["max_lon_e7"] / 10000000,
-            self.header["max_lat_e7"] / 10000000,
-        )
+        return self._bounds
 
     @property
     def center(self) -> tuple[float, float, int]:
         """The center of the archive as (center_lon, center_lat, center_zoom)."""
-        return (
-            self.header["center_lon_e7"] / 10000000,
-            self.header["center_lat_e7"] / 10000000,
-            self.header["center_zoom"],
-        )
+        return self._center
 
     @property
     def tile_compression(self) -> Compression:
         """Return the compression type used for tiles."""
-        return self.header["tile_compression"]
+        return self._tile_compression
 
     @property
     def tile_type(self) -> TileType:
         """Return the type of tiles contained in the archive."""
-        return self.header["tile_type"]
+        return self._tile_type
@@ -0,0 +1,229 @@
+"""A built-in store for reading PMTiles archives over HTTP."""
+
+from __future__ import annotations
+
+import warnings
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Self
+
+try:
+    import h2  # noqa: F401
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+if httpx is None and aiohttp is None:
+    msg = (
+        "httpx (with HTTP/2 support) or aiohttp is required for "
+        "async_pmtiles.http. Install one with `pip install 'async-pmtiles[http2]'` "
+        "or `pip install 'async-pmtiles[http]'`."
+    )
+    raise ImportError(msg)
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+
+@dataclass
+class HTTPStore:
+    """A [Store][async_pmtiles.Store] that fetches byte ranges over HTTP.
+
+    A single connection pool is kept for the lifetime of the store, so TCP and TLS
+    connections are reused across requests and across every reader sharing the
+    store. Close the store when done, or use it as an async context manager:
+
+    ```py
+    from async_pmtiles import PMTilesReader
+    from async_pmtiles.http import HTTPStore
+
+    url = "https://r2-public.protomaps.com/protomaps-sample-datasets"
+    async with HTTPStore(url) as store:
+        src = await PMTilesReader.open("cb_2018_us_zcta510_500k.pmtiles", store=store)
+        tiles = await src.get_tiles([(0, 0, 0), (1, 1, 1)])
+    ```
+
+    When [httpx] is installed with HTTP/2 support (the `http2` extra), requests
+    are sent over HTTP/2, which multiplexes the many small concurrent range
+    requests of a tile batch over a single connection per origin. Otherwise
+    [aiohttp] is used over HTTP/1.1, with one connection per in-flight request.
+    In that case `max_per_host` should be at least the reader's `max_concurrency`;
+    otherwise concurrent tile requests queue for a free connection.
+
+    [httpx]: https://www.python-httpx.org/
+    [aiohttp]: https://docs.aiohttp.org/
+    """
+
+    base_url: str
+    """The URL that paths passed to `get_range_async` are relative to."""
+
+    max_connections: int = 32
+    """The maximum number of open connections across all hosts."""
+
+    max_per_host: int = 16
+    """The maximum number of open connections to a single host, over HTTP/1.1.
+
+    httpx has no per-host limit, so this is ignored over HTTP/2.
+    """
+
+    max_keepalive: int = 16
+    """The maximum number of idle connections kept alive, over HTTP/2.
+
+    aiohttp bounds idle connections by `max_connections` and `max_per_host`
+    instead, so this is ignored over HTTP/1.1.
+    """
+
+    http2: bool | None = None
+    """Whether to use HTTP/2 through httpx.
+
+    Defaults to HTTP/2 when httpx and h2 are installed, and aiohttp otherwise.
+    """
+
+    _client: httpx.AsyncClient | None = field(
+        default=None,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _session: aiohttp.ClientSession | None = field(
+        default=None,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _warned_full_body: bool = field(
+        default=False,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
+    def __post_init__(self) -> None:  # noqa: D105
+        if self.http2 is None:
+            self.http2 = httpx is not None
+        elif self.http2 and httpx is None:
+            msg = "HTTP/2 requires httpx and h2: `pip install 'async-pmtiles[http2]'`."
+            raise ValueError(msg)
+        elif not self.http2 and aiohttp is None:
+            msg = "HTTP/1.1 requires aiohttp: `pip install 'async-pmtiles[http]'`."
+            raise ValueError(msg)
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            limits = httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive,
+                keepalive_expiry=60,
+            )
+            self._client = httpx.AsyncClient(http2=True, limits=limits)
+
+        return self._client
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        # Created lazily, since aiohttp sessions must be created inside a running
+        # event loop
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections,
+                limit_per_host=self.max_per_host,
+                ttl_dns_cache=300,
+                keepalive_timeout=60,
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+
+        return self._session
+
+    def _url(self, path: str) -> str:
+        if not path:
+            return self.base_url
+
+        return f"{self.base_url.rstrip('/')}/{path.lstrip('/')}"
+
+    def _range_body(self, status: int, body: bytes, start: int, length: int) -> bytes:
+        """Return the requested byte range from a successful response body."""
+        if status == HTTPStatus.PARTIAL_CONTENT:
+            return body
+
+        if status == HTTPStatus.OK:
+            # The server ignored the Range header and sent the whole file
+            if not self._warned_full_body:
+                self._warned_full_body = True
+                msg = (
+                    f"{self.base_url} ignored a Range request and sent the whole "
+                    "file; every read will download the entire archive"
+                )
+                warnings.warn(msg, stacklevel=3)
+            return body[start : start + length]
+
+        msg = f"Unexpected HTTP status {status} for a range request"
+        raise ValueError(msg)
+
+    async def get_range_async(
+        self,
+        path: str,
+        *,
+        start: int,
+        length: int,
+    ) -> bytes:
+        """Asynchronously fetch a byte range from a file.
+
+        A server that ignores the `Range` header and responds with `200 OK` and
+        the whole file is tolerated: the requested range is sliced out of the
+        response. Every read then downloads the entire archive, which is slow for
+        large files, so a warning is emitted the first time this happens.
+
+        Args:
+            path: The path to the file, relative to `base_url`.
+            start: The starting byte offset of the range to fetch.
+            length: The length of the range to fetch.
+
+        Raises:
+            httpx.HTTPStatusError: If the server returns an error status, over HTTP/2.
+            aiohttp.ClientResponseError: If the server returns an error status, over
+                HTTP/1.1.
+            ValueError: If the server returns a status other than `200` or `206`.
+
+        Returns:
+            Byte buffer.
+
+        """
+        inclusive_end = start + length - 1
+        headers = {"Range": f"bytes={start}-{inclusive_end}"}
+        if self.http2:
+            response = await self._get_client().get(self._url(path), headers=headers)
+            response.raise_for_status()
+            status, body = response.status_code, response.content
+            return self._range_body(status, body, start, length)
+
+        async with self._get_session().get(
+            self._url(path),
+            headers=headers,
+        ) as response:
+            response.raise_for_status()
+            body = await response.read()
+            return self._range_body(response.status, body, start, length)
+
+    async def close(self) -> None:
+        """Close the underlying connection pool."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> Self:  # noqa: D105
+        return self
+
+    async def __aexit__(  # noqa: D105
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.close()
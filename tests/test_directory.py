@@ -0,0 +1,48 @@
+"""Test directory parsing."""
+
+import gzip
+from array import array
+from pathlib import Path
+
+import pytest
+from pmtiles.tile import deserialize_directory, deserialize_header
+
+from async_pmtiles._directory import parse_directory_into
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+VECTOR_PMTILES = "protomaps(vector)ODbL_firenze.pmtiles"
+
+
+def _root_directory() -> bytes:
+    data = (FIXTURES_DIR / VECTOR_PMTILES).read_bytes()
+    header = deserialize_header(data[:127])
+    start = header["root_offset"]
+    return data[start : start + header["root_length"]]
+
+
+def test_parse_directory_into():
+    """Columns should match upstream's deserialized entries."""
+    buf = _root_directory()
+    entries = deserialize_directory(buf)
+
+    ids, offsets, lengths, runs = array("Q"), array("Q"), array("I"), array("I")
+    count = parse_directory_into(gzip.decompress(buf), ids, offsets, lengths, runs)
+
+    assert count == len(entries)
+    assert list(ids) == [entry.tile_id for entry in entries]
+    assert list(offsets) == [entry.offset for entry in entries]
+    assert list(lengths) == [entry.length for entry in entries]
+    assert list(runs) == [entry.run_length for entry in entries]
+
+
+def test_parse_directory_into_truncated():
+    data = gzip.decompress(_root_directory())
+
+    with pytest.raises(EOFError):
+        parse_directory_into(
+            data[:-3],
+            array("Q"),
+            array("Q"),
+            array("I"),
+            array("I"),
+        )
@@ -0,0 +1,116 @@
+"""Test HTTPStore."""
+
+import warnings
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+import pytest
+from aiohttp import web
+from pmtiles.tile import Compression, TileType
+
+from async_pmtiles import PMTilesReader
+from async_pmtiles.http import HTTPStore
+
+BASE_URL = "https://r2-public.protomaps.com/protomaps-sample-datasets"
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+VECTOR_PMTILES = "protomaps(vector)ODbL_firenze.pmtiles"
+
+
+@asynccontextmanager
+async def serve_fixtures() -> AsyncIterator[str]:
+    """Serve the fixtures locally, with and without Range support.
+
+    `/ranged/<name>` honors Range headers; `/full/<name>` ignores them and always
+    responds `200 OK` with the whole file; `/empty/<name>` responds `204`.
+    """
+
+    async def ranged(request: web.Request) -> web.FileResponse:
+        return web.FileResponse(FIXTURES_DIR / request.match_info["name"])
+
+    async def full(request: web.Request) -> web.Response:
+        path = FIXTURES_DIR / request.match_info["name"]
+        if not path.exists():
+            raise web.HTTPNotFound
+        return web.Response(body=path.read_bytes())
+
+    async def empty(_request: web.Request) -> web.Response:
+        return web.Response(status=204)
+
+    app = web.Application()
+    app.router.add_get("/ranged/{name}", ranged)
+    app.router.add_get("/full/{name}", full)
+    app.router.add_get("/empty/{name}", empty)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    try:
+        port = runner.addresses[0][1]
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        await runner.cleanup()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("http2", [True, False])
+@pytest.mark.parametrize("mode", ["ranged", "full"])
+async def test_http_store_local(http2, mode):
+    """Range responses should be exact, even when the server ignores Range."""
+    expected = (FIXTURES_DIR / VECTOR_PMTILES).read_bytes()
+
+    async with (
+        serve_fixtures() as url,
+        HTTPStore(f"{url}/{mode}", http2=http2) as store,
+    ):
+        if mode == "full":
+            with pytest.warns(UserWarning, match="ignored a Range request"):
+                data = await store.get_range_async(
+                    VECTOR_PMTILES,
+                    start=796,
+                    length=582,
+                )
+        else:
+            data = await store.get_range_async(VECTOR_PMTILES, start=796, length=582)
+        assert bytes(data) == expected[796 : 796 + 582]
+
+        # The warning is only emitted once per store
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            src = await PMTilesReader.open(VECTOR_PMTILES, store=store)
+        assert src.minzoom == 0
+        tile = await src.get_tile(0, 0, 0)
+        assert bytes(tile) == data
+
+        with pytest.raises(Exception, match="404"):
+            await store.get_range_async("missing.pmtiles", start=0, length=127)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("http2", [True, False])
+async def test_http_store_unexpected_status(http2):
+    async with (
+        serve_fixtures() as url,
+        HTTPStore(f"{url}/empty", http2=http2) as store,
+    ):
+        with pytest.raises(ValueError, match="Unexpected HTTP status 204"):
+            await store.get_range_async(VECTOR_PMTILES, start=0, length=127)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("http2", [True, False])
+async def test_http_store(http2):
+    async with HTTPStore(BASE_URL, http2=http2) as store:
+        src = await PMTilesReader.open("cb_2018_us_zcta510_500k.pmtiles", store=store)
+
+        assert src.bounds == (-176.684714, -14.37374, 145.830418, 71.341223)
+        assert src.minzoom == 0
+        assert src.maxzoom == 7
+        assert src.tile_compression == Compression.GZIP
+        assert src.tile_type == TileType.MVT
+
+        tiles = await src.get_tiles([(0, 0, 0), (0, 0, 1)])
+        assert tiles[0] is not None
+
+    assert store._client is None
+    assert store._session is None
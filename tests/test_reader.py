@@ -1,15 +1,27 @@
 """Test PMTilesReader."""
 
+import asyncio
+import gzip
+import random
 from collections.abc import Buffer
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 
 import pytest
 from aiohttp import ClientSession
 from obstore.store import LocalStore
-from pmtiles.tile import Compression, TileType
+from pmtiles.reader import MmapSource
+from pmtiles.reader import Reader as SyncReader
+from pmtiles.tile import (
+    Compression,
+    TileType,
+    deserialize_directory,
+    deserialize_header,
+    tileid_to_zxy,
+)
+from pmtiles.writer import Writer
 
-from async_pmtiles import PMTilesReader, Store
+from async_pmtiles import BudgetExceededError, PMTilesReader, Store, _reader
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 VECTOR_PMTILES = "protomaps(vector)ODbL_firenze.pmtiles"
@@ -55,6 +67,323 @@ async def test_reader_raster():
     assert "type" in metadata
 
 
+@pytest.mark.asyncio
+async def test_get_tiles():
+    """Batched reads should match sequential get_tile calls, in input order."""
+    store = LocalStore(FIXTURES_DIR)
+
+    src = await PMTilesReader.open(VECTOR_PMTILES, store=store, max_concurrency=2)
+    coords = [(0, 0, 0), (8704, 5972, 14), (34, 23, 6), (0, 0, 14)]
+    tiles = await src.get_tiles(coords)
+
+    assert len(tiles) == len(coords)
+    for (x, y, z), tile in zip(coords, tiles, strict=True):
+        expected = await src.get_tile(x, y, z)
+        if expected is None:
+            assert tile is None
+        else:
+            assert bytes(tile) == bytes(expected)
+
+    assert tiles[0] is not None
+    assert tiles[-1] is None
+
+    batch = await src.get_tiles_batch(coords)
+    assert len(batch) == len(coords)
+    for tile, expected in zip(batch, tiles, strict=True):
+        if expected is None:
+            assert tile is None
+        else:
+            assert bytes(tile) == bytes(expected)
+
+
+@pytest.mark.asyncio
+async def test_decompress_tile():
+    store = LocalStore(FIXTURES_DIR)
+
+    src = await PMTilesReader.open(VECTOR_PMTILES, store=store)
+    for x, y, z in [(0, 0, 0), (34, 23, 6), (8704, 5972, 14)]:
+        tile = await src.get_tile(x, y, z)
+        assert src.decompress_tile(tile) == gzip.decompress(tile)
+
+    src = await PMTilesReader.open(RASTER_PMTILES, store=store)
+    tile = await src.get_tile(43, 100, 8)
+    assert src.decompress_tile(tile) is tile
+
+
+@dataclass
+class CountingStore(Store):
+    store: Store
+    requests: list[tuple[int, int]] = field(default_factory=list)
+
+    async def get_range_async(
+        self,
+        path: str,
+        *,
+        start: int,
+        length: int,
+    ) -> Buffer:
+        self.requests.append((start, length))
+        return await self.store.get_range_async(path, start=start, length=length)
+
+
+@pytest.mark.asyncio
+async def test_max_concurrency_validation(monkeypatch):
+    store = LocalStore(FIXTURES_DIR)
+
+    with pytest.raises(ValueError, match="max_concurrency must be at least 1"):
+        await PMTilesReader.open(VECTOR_PMTILES, store=store, max_concurrency=0)
+
+    monkeypatch.setenv("ASYNC_PMTILES_CONCURRENCY", "0")
+    with pytest.raises(ValueError, match="max_concurrency must be at least 1"):
+        await PMTilesReader.open(VECTOR_PMTILES, store=store)
+
+    monkeypatch.setenv("ASYNC_PMTILES_CONCURRENCY", "3")
+    src = await PMTilesReader.open(VECTOR_PMTILES, store=store)
+    assert src.max_concurrency == 3
+
+
+@pytest.mark.asyncio
+async def test_directory_cache():
+    """The root directory should be loaded once and then served from cache."""
+    store = CountingStore(LocalStore(FIXTURES_DIR))
+
+    src = await PMTilesReader.open(VECTOR_PMTILES, store=store)
+    root = (src.header["root_offset"], src.header["root_length"])
+    assert root in src._dir_cache
+
+    await src.get_tile(0, 0, 0)
+    await src.get_tile(34, 23, 6)
+    # The root directory is sliced out of the prefetched header bytes
+    assert root not in store.requests
+    assert store.requests[0] == (0, 16384)
+
+    uncached = CountingStore(LocalStore(FIXTURES_DIR))
+    src = await PMTilesReader.open(
+        VECTOR_PMTILES,
+        store=uncached,
+        cache_size=0,
+        prefetch_bytes=0,
+    )
+    assert uncached.requests == [(0, 127)]
+    await src.get_tile(0, 0, 0)
+    await src.get_tile(34, 23, 6)
+    assert uncached.requests.count(root) == 2
+    assert not src._dir_cache
+
+
+@pytest.mark.asyncio
+async def test_get_tiles_batch_coalesce():
+    """Nearby tiles should be fetched together without changing the results."""
+    coords = [(34, 23, 6), (34, 24, 6), (35, 23, 6), (35, 24, 6), (0, 0, 0)]
+
+    separate = CountingStore(LocalStore(FIXTURES_DIR))
+    src = await PMTilesReader.open(
+        VECTOR_PMTILES,
+        store=separate,
+        max_coalesce_gap=-1,
+    )
+    expected = await src.get_tiles_batch(coords)
+
+    coalesced = CountingStore(LocalStore(FIXTURES_DIR))
+    src = await PMTilesReader.open(
+        VECTOR_PMTILES,
+        store=coalesced,
+        max_coalesce_gap=1 << 20,
+        max_coalesce_size=1 << 22,
+    )
+    tiles = await src.get_tiles_batch(coords)
+
+    assert len(coalesced.requests) < len(separate.requests)
+    for tile, other in zip(tiles, expected, strict=True):
+        if other is None:
+            assert tile is None
+        else:
+            assert bytes(tile) == bytes(other)
+
+
+@pytest.mark.asyncio
+async def test_get_tiles_batch_shared_offset(tmp_path):
+    """Deduplicated tiles share an offset; a negative gap still reads each once."""
+    path = tmp_path / "shared.pmtiles"
+    with path.open("wb") as f:
+        writer = Writer(f)
+        for tile_id in range(3):
+            writer.write_tile(tile_id, b"ocean")
+        writer.finalize(
+            {
+                "tile_compression": Compression.NONE,
+                "tile_type": TileType.MVT,
+                "min_lon_e7": 0,
+                "min_lat_e7": 0,
+                "max_lon_e7": 0,
+                "max_lat_e7": 0,
+                "center_zoom": 0,
+                "center_lon_e7": 0,
+                "center_lat_e7": 0,
+            },
+            {},
+        )
+
+    coords = [(0, 0, 0), (0, 0, 1), (0, 1, 1), (0, 1, 1)]
+    for max_coalesce_gap, tile_requests in [(-1, 4), (0, 1), (16384, 1)]:
+        store = CountingStore(LocalStore(tmp_path))
+        src = await PMTilesReader.open(
+            "shared.pmtiles",
+            store=store,
+            max_coalesce_gap=max_coalesce_gap,
+        )
+        tiles = await src.get_tiles_batch(coords)
+
+        assert [bytes(tile) for tile in tiles] == [b"ocean"] * 4
+        # The first request is the prefix, which covers the root directory
+        assert len(store.requests) - 1 == tile_requests
+
+
+@pytest.mark.asyncio
+async def test_close():
+    store = LocalStore(FIXTURES_DIR)
+
+    async with await PMTilesReader.open(VECTOR_PMTILES, store=store) as src:
+        tile = await src.get_tile(0, 0, 0)
+        src.decompress_tile(tile)
+        assert src._dir_cache
+
+    assert not src._dir_cache
+
+    # The reader stays usable after closing
+    assert bytes(await src.get_tile(0, 0, 0)) == bytes(tile)
+
+
+@pytest.mark.asyncio
+async def test_fetch_metrics_and_budget():
+    store = LocalStore(FIXTURES_DIR)
+    fetches = []
+
+    src = await PMTilesReader.open(
+        VECTOR_PMTILES,
+        store=store,
+        on_fetch=lambda offset, length: fetches.append((offset, length)),
+    )
+    assert fetches == [(0, 16384)]
+
+    tile = await src.get_tile(0, 0, 0)
+    assert src.fetch_count == 2
+    assert src.fetched_bytes == 16384 + len(tile)
+    assert src.cache_hits == 1
+    assert fetches[-1][1] == len(tile)
+
+    src = await PMTilesReader.open(VECTOR_PMTILES, store=store, bytes_budget=16384)
+    with pytest.raises(BudgetExceededError):
+        await src.get_tile(0, 0, 0)
+    assert src.fetched_bytes == 16384
+
+    # A prefix larger than the budget is rejected before anything is requested
+    counting_store = CountingStore(store)
+    with pytest.raises(BudgetExceededError):
+        await PMTilesReader.open(
+            VECTOR_PMTILES,
+            store=counting_store,
+            bytes_budget=127,
+        )
+    assert counting_store.requests == []
+
+
+def write_leaf_archive(path: Path) -> int:
+    """Write an archive whose directory is too large for the root alone.
+
+    Irregular tile IDs and sizes keep the directory from compressing well, so
+    the writer has to split it into leaf directories. Returns the largest
+    tile ID written.
+    """
+    rng = random.Random(0)  # noqa: S311 (deterministic test data)
+    tile_id = 0
+    with path.open("wb") as f:
+        writer = Writer(f)
+        for _ in range(60000):
+            tile_id += rng.randint(1, 50)
+            writer.write_tile(tile_id, f"tile {tile_id}".encode() * rng.randint(1, 20))
+
+        writer.finalize(
+            {
+                "tile_compression": Compression.NONE,
+                "tile_type": TileType.MVT,
+                "min_lon_e7": 0,
+                "min_lat_e7": 0,
+                "max_lon_e7": 0,
+                "max_lat_e7": 0,
+                "center_zoom": 0,
+                "center_lon_e7": 0,
+                "center_lat_e7": 0,
+            },
+            {},
+        )
+
+    return tile_id
+
+
+@pytest.mark.asyncio
+async def test_leaf_directories(tmp_path):
+    """Lookups through leaf directories should match the upstream reader."""
+    max_tile_id = write_leaf_archive(tmp_path / "leaves.pmtiles")
+    data = (tmp_path / "leaves.pmtiles").read_bytes()
+
+    header = deserialize_header(data[:127])
+    assert header["leaf_directory_length"] > 0
+    root_start = header["root_offset"]
+    root = deserialize_directory(data[root_start : root_start + header["root_length"]])
+    leaves = {
+        (header["leaf_directory_offset"] + entry.offset, entry.length)
+        for entry in root
+        if entry.run_length == 0
+    }
+    assert len(leaves) > 1
+
+    # A mix of present and missing tiles, spread across every leaf
+    tile_ids = range(0, max_tile_id, max_tile_id // 60)
+    coords = [(x, y, z) for z, x, y in map(tileid_to_zxy, tile_ids)]
+    with (tmp_path / "leaves.pmtiles").open("rb") as f:
+        reader = SyncReader(MmapSource(f))
+        expected = [reader.get(z, x, y) for x, y, z in coords]
+    assert any(tile is None for tile in expected)
+    assert any(tile is not None for tile in expected)
+
+    src = await PMTilesReader.open("leaves.pmtiles", store=LocalStore(tmp_path))
+    for (x, y, z), tile in zip(coords, expected, strict=True):
+        result = await src.get_tile(x, y, z)
+        assert (None if result is None else bytes(result)) == tile
+
+    # Without a cache, get_tiles_batch must still fetch each leaf only once
+    store = CountingStore(LocalStore(tmp_path))
+    src = await PMTilesReader.open("leaves.pmtiles", store=store, cache_size=0)
+    batch = await src.get_tiles_batch(coords)
+    for result, tile in zip(batch, expected, strict=True):
+        assert (None if result is None else bytes(result)) == tile
+
+    fetched_leaves = [request for request in store.requests if request in leaves]
+    assert sorted(fetched_leaves) == sorted(leaves)
+
+
+@pytest.mark.asyncio
+async def test_metadata_in_thread(monkeypatch):
+    """Metadata inflated in a worker thread should match inline inflation."""
+    store = LocalStore(FIXTURES_DIR)
+    src = await PMTilesReader.open(VECTOR_PMTILES, store=store)
+    expected = await src.metadata()
+
+    calls = []
+    to_thread = asyncio.to_thread
+
+    async def spy(func, /, *args: object):
+        calls.append(func)
+        return await to_thread(func, *args)
+
+    monkeypatch.setattr(_reader, "_DECOMPRESS_THREAD_THRESHOLD", 0)
+    monkeypatch.setattr(asyncio, "to_thread", spy)
+
+    assert await src.metadata() == expected
+    assert len(calls) == 1
+
+
 @pytest.mark.asyncio
 async def test_reader_bad_spec():
     """Should raise an error if not spec == 3."""